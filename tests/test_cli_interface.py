@@ -39,9 +39,12 @@ def test_cli_arguments(capsys: Any) -> None:
     out, err = capsys.readouterr()
     assert err == ""
     assert exit_code == 0
-    assert out.split("\n")[0] == "1984-08-01T23:59:00.000000Z"
-    assert out.split("\n")[1] == "1970-01-01T00:16:40.000000Z"
-    assert out.split("\n")[2] == "1969-12-31T23:43:19.446001Z"
+    assert out.split("\n") == [
+        "1984-08-01T23:59:00.000000Z",
+        "1970-01-01T00:16:40.000000Z",
+        "1969-12-31T23:43:19.446001Z",
+        "",
+    ]
 
 
 def test_cli_unixtime(capsys: Any) -> None:
@@ -1,3 +1,4 @@
+import datetime
 import json
 
 import pytest
@@ -91,6 +92,20 @@ def test_utcnow_resolution_uniqueness_1000() -> None:
     assert len(set([utcnow.as_string() for x in range(5000)])) >= 1000
 
 
+def test_return_type_is_str() -> None:
+    import utcnow
+
+    assert type(utcnow()) is str  # type: ignore
+    assert type(utcnow.utcnow()) is str
+    assert type(utcnow.as_string()) is str
+    assert type(utcnow.as_string("1984-08-01")) is str
+    assert type(utcnow.as_string("1984-08-01T13:38:00.123450Z")) is str
+    assert type(utcnow.as_string("1984-08-01 13:38:00+02:00")) is str
+    assert type(utcnow.as_string(datetime.datetime(1984, 8, 1, 13, 38))) is str
+    assert type(utcnow.as_string(1693005993.285967)) is str
+    assert type(str(utcnow)) is str
+
+
 def test_uniqueness_as_reference() -> None:
     import utcnow
 
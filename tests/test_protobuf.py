@@ -3,6 +3,8 @@ import datetime
 import pytest
 from google.protobuf.timestamp_pb2 import Timestamp
 
+import utcnow
+
 
 def protobuf_timestamp_from_json_string(json_string: str) -> Timestamp:
     """Convert a JSON string (RFC3339) to a protobuf Timestamp."""
@@ -33,46 +35,44 @@ def protobuf_timestamp_from_json_string(json_string: str) -> Timestamp:
     ],
 )
 def test_protobuf_values(value: Timestamp, expected_output: str, expect_error: bool) -> None:
-    import utcnow
+    if expect_error:
+        with pytest.raises(ValueError):
+            utcnow.as_string(value)
+        with pytest.raises(ValueError):
+            utcnow.as_datetime(value)
+        with pytest.raises(ValueError):
+            utcnow.as_unixtime(value)
+        with pytest.raises(ValueError):
+            utcnow.as_protobuf(value)
+        return
 
-    try:
-        assert isinstance(utcnow.as_string(value), str)
-        assert isinstance(utcnow.as_datetime(value), datetime.datetime)
-        assert isinstance(utcnow.as_unixtime(value), (float, int))
-        assert isinstance(utcnow.as_protobuf(value), Timestamp)
-        if expect_error:
-            assert False
-    except Exception:
-        if not expect_error:
-            raise
-        if not expect_error:
-            # unreachable
-            assert False
+    string_value = utcnow.as_string(value)
+    datetime_value = utcnow.as_datetime(value)
+    protobuf_value = utcnow.as_protobuf(value)
+    assert isinstance(string_value, str)
+    assert isinstance(datetime_value, datetime.datetime)
+    assert isinstance(utcnow.as_unixtime(value), (float, int))
+    assert isinstance(protobuf_value, Timestamp)
 
-        assert True
-        return
+    expected_datetime = utcnow.as_datetime(expected_output)
+    value_unixtime = round(value.seconds + value.nanos * 1e-9, 9)
 
-    assert utcnow.as_string(value) == expected_output
+    assert string_value == expected_output
     assert utcnow.as_string(expected_output) == expected_output
-    assert utcnow.as_string(expected_output) == utcnow.as_string(expected_output)
-    assert utcnow.as_datetime(value) == utcnow.as_datetime(expected_output)
-    assert utcnow.utcnow(utcnow.as_datetime(value)) == utcnow.utcnow(utcnow.as_datetime(expected_output))
-    assert utcnow.utcnow(utcnow.as_datetime(value).replace(tzinfo=None)) == expected_output
-    assert utcnow.as_string(utcnow.utcnow(utcnow.as_datetime(value))) == expected_output
-    assert utcnow.as_string(utcnow.as_protobuf(value).SerializeToString()) == expected_output
-
-    value2 = utcnow.as_protobuf(value)
-    assert round(value2.seconds + value2.nanos * 1e-9, 9) == round(value.seconds + value.nanos * 1e-9, 9)
+    assert datetime_value == expected_datetime
+    assert utcnow.utcnow(datetime_value) == utcnow.utcnow(expected_datetime)
+    assert utcnow.utcnow(datetime_value.replace(tzinfo=None)) == expected_output
+    assert utcnow.as_string(utcnow.utcnow(datetime_value)) == expected_output
+    assert utcnow.as_string(protobuf_value.SerializeToString()) == expected_output
+    assert round(protobuf_value.seconds + protobuf_value.nanos * 1e-9, 9) == value_unixtime
 
     message = Timestamp()
-    message.FromJsonString(utcnow.as_string(value))
-    assert round(message.seconds + message.nanos * 1e-9, 9) == round(value.seconds + value.nanos * 1e-9, 9)
+    message.FromJsonString(string_value)
+    assert round(message.seconds + message.nanos * 1e-9, 9) == value_unixtime
     assert utcnow.as_string(message) == expected_output
-    assert message == utcnow.as_protobuf(value)
+    assert message == protobuf_value
 
 
 def test_from_protobuf_binary() -> None:
-    import utcnow
-
     protobuf_msg_binary = b"\x08\xc4\xec\xbc\x9c\x06\x10\xa0\xa1\xb0Q"
     assert utcnow.get(protobuf_msg_binary) == "2022-12-06T12:32:04.170660Z"
@@ -5,26 +5,25 @@ import pytest
 import utcnow
 
 
-def test_synchronizer_basic() -> None:
-    with utcnow.synchronizer as synchronizer:
+def assert_synchronized(synchronizer: Any) -> None:
+    assert synchronizer.datetime == utcnow.as_datetime()
+    assert synchronizer.time == utcnow.as_unixtime()
+    assert synchronizer.time_ns == int(utcnow.as_unixtime() * 1e6) * 1_000
+
+
+@pytest.mark.parametrize(
+    "synchronizer_",
+    [utcnow.synchronizer, utcnow.utcnow.synchronizer],
+    ids=["utcnow.synchronizer", "utcnow.utcnow.synchronizer"],
+)
+def test_synchronizer_basic(synchronizer_: Any) -> None:
+    with synchronizer_ as synchronizer:
         assert utcnow.rfc3339_timestamp() == utcnow.rfc3339_timestamp("now")
         assert utcnow.as_unixtime() == utcnow.as_unixtime("now")
         assert utcnow.as_protobuf() == utcnow.as_protobuf("now")
         assert utcnow.as_datetime() == utcnow.as_datetime("now")
 
-        assert synchronizer.datetime == utcnow.as_datetime()
-        assert synchronizer.time == utcnow.as_unixtime()
-        assert synchronizer.time_ns == int(utcnow.as_unixtime() * 1e6) * 1_000
-
-    with utcnow.utcnow.synchronizer as synchronizer:
-        assert utcnow.rfc3339_timestamp() == utcnow.rfc3339_timestamp("now")
-        assert utcnow.as_unixtime() == utcnow.as_unixtime("now")
-        assert utcnow.as_protobuf() == utcnow.as_protobuf("now")
-        assert utcnow.as_datetime() == utcnow.as_datetime("now")
-
-        assert synchronizer.datetime == utcnow.as_datetime()
-        assert synchronizer.time == utcnow.as_unixtime()
-        assert synchronizer.time_ns == int(utcnow.as_unixtime() * 1e6) * 1_000
+        assert_synchronized(synchronizer)
 
 
 def test_synchronizer_timediff() -> None:
@@ -50,52 +49,48 @@ def test_synchronizer_now() -> None:
     assert utcnow.timediff(created_time, expire_time, "seconds") == 900.0
 
 
-def test_synchronizer_specific() -> None:
-    with utcnow.synchronizer("2022-01-01T01:00:00.000000Z") as synchronizer:
-        created_time = utcnow.rfc3339_timestamp()
-        expire_time = utcnow.rfc3339_timestamp("now", "+15m")
-
-        assert synchronizer.datetime == utcnow.as_datetime()
-        assert synchronizer.time == utcnow.as_unixtime()
-        assert synchronizer.time_ns == int(utcnow.as_unixtime() * 1e6) * 1_000
-
-    assert utcnow.timediff(created_time, expire_time, "seconds") == 900.0
-    assert created_time == "2022-01-01T01:00:00.000000Z"
-    assert expire_time == "2022-01-01T01:15:00.000000Z"
-
-
-def test_synchronizer_precise_unixtime() -> None:
-    with utcnow.synchronizer(1695694079.9417229) as synchronizer:
-        created_time = utcnow.rfc3339_timestamp()
-        expire_time = utcnow.rfc3339_timestamp("now", "+15m")
-
-        assert synchronizer.datetime == utcnow.as_datetime()
-        assert synchronizer.time == utcnow.as_unixtime()
-        assert synchronizer.time_ns == int(utcnow.as_unixtime() * 1e6) * 1_000
-
-        assert synchronizer.time == 1695694079.941723
-        assert synchronizer.time_ns == 1695694079941723000
-
-    assert utcnow.timediff(created_time, expire_time, "seconds") == 900.0
-    assert created_time == "2023-09-26T02:07:59.941723Z"
-    assert expire_time == "2023-09-26T02:22:59.941723Z"
-
-
-def test_synchronizer_approximate_unixtime() -> None:
-    with utcnow.synchronizer(1695694079.941723) as synchronizer:
+@pytest.mark.parametrize(
+    "value, expected_time, expected_time_ns, expected_created_time, expected_expire_time",
+    [
+        (
+            "2022-01-01T01:00:00.000000Z",
+            1640998800.0,
+            1640998800000000000,
+            "2022-01-01T01:00:00.000000Z",
+            "2022-01-01T01:15:00.000000Z",
+        ),
+        (
+            1695694079.9417229,
+            1695694079.941723,
+            1695694079941723000,
+            "2023-09-26T02:07:59.941723Z",
+            "2023-09-26T02:22:59.941723Z",
+        ),
+        (
+            1695694079.941723,
+            1695694079.941723,
+            1695694079941723000,
+            "2023-09-26T02:07:59.941723Z",
+            "2023-09-26T02:22:59.941723Z",
+        ),
+    ],
+    ids=["specific", "precise_unixtime", "approximate_unixtime"],
+)
+def test_synchronizer_specific(
+    value: Any, expected_time: float, expected_time_ns: int, expected_created_time: str, expected_expire_time: str
+) -> None:
+    with utcnow.synchronizer(value) as synchronizer:
         created_time = utcnow.rfc3339_timestamp()
         expire_time = utcnow.rfc3339_timestamp("now", "+15m")
 
-        assert synchronizer.datetime == utcnow.as_datetime()
-        assert synchronizer.time == utcnow.as_unixtime()
-        assert synchronizer.time_ns == int(utcnow.as_unixtime() * 1e6) * 1_000
+        assert_synchronized(synchronizer)
 
-        assert synchronizer.time == 1695694079.941723
-        assert synchronizer.time_ns == 1695694079941723000
+        assert synchronizer.time == expected_time
+        assert synchronizer.time_ns == expected_time_ns
 
     assert utcnow.timediff(created_time, expire_time, "seconds") == 900.0
-    assert created_time == "2023-09-26T02:07:59.941723Z"
-    assert expire_time == "2023-09-26T02:22:59.941723Z"
+    assert created_time == expected_created_time
+    assert expire_time == expected_expire_time
 
 
 def test_synchronizer_only_modifier() -> None:
@@ -1,9 +1,9 @@
 import pytest
 
+import utcnow
 
-def test_timediff_basic() -> None:
-    import utcnow
 
+def test_timediff_basic() -> None:
     assert utcnow.timediff(0, 0) == 0
     assert utcnow.timediff(0, 1) == 1
     assert utcnow.timediff(1, 0) == -1
@@ -28,8 +28,6 @@ def test_timediff_basic() -> None:
 
 
 def test_timediff_comparison() -> None:
-    import utcnow
-
     assert utcnow.timediff("1984-08-01", "1984-08-01") == 0
 
     assert utcnow.timediff("1984-08-01", "1984-08-02") == 86400
@@ -72,8 +70,6 @@ def test_timediff_comparison() -> None:
 
 
 def test_timediff_birth() -> None:
-    import utcnow
-
     begin = "1984-08-01T13:38:00.471100Z"
     end = "2021-02-27T08:54:30.999999Z"
 
@@ -86,8 +82,6 @@ def test_timediff_birth() -> None:
 
 
 def test_timediff_frozen_now() -> None:
-    import utcnow
-
     assert utcnow.timediff("now", "now") == 0
     assert utcnow.timediff("now", "+1h") == 3600.0
     assert utcnow.timediff("+2h", "+3600s") == -3600.0
@@ -96,7 +90,5 @@ def test_timediff_frozen_now() -> None:
 
 
 def test_timediff_invalid_unit() -> None:
-    import utcnow
-
     with pytest.raises(ValueError):
         utcnow.timediff(0, 1, "months")
@@ -1,6 +1,6 @@
 import datetime
 from decimal import Decimal
-from typing import Union
+from typing import Any, Union
 
 import pytest
 from google.protobuf.timestamp_pb2 import Timestamp
@@ -63,6 +63,10 @@ from google.protobuf.timestamp_pb2 import Timestamp
         (Decimal("-1614300199."), "1918-11-05T23:16:41.000000Z", False),
         (Decimal("-.9919"), "1969-12-31T23:59:59.008100Z", False),
         (Decimal("5e5"), "1970-01-06T18:53:20.000000Z", False),
+        (-62135596800, "0001-01-01T00:00:00.000000Z", False),
+        (253402300799, "9999-12-31T23:59:59.000000Z", False),
+        (-62135596801, "", True),
+        (253402300800, "", True),
         ("1.0.0", "", True),
         ("--1", "", True),
         ("--", "", True),
@@ -105,3 +109,44 @@ def test_unixtime_values(value: Union[int, float, str, Decimal], expected_output
     assert utcnow.utcnow(utcnow.as_datetime(value)) == utcnow.utcnow(utcnow.as_datetime(expected_output))
     assert utcnow.utcnow(utcnow.as_datetime(value).replace(tzinfo=None)) == expected_output
     assert utcnow.as_string(utcnow.utcnow(utcnow.as_datetime(value))) == expected_output
+
+
+def test_unixtime_platform_range_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    import utcnow
+
+    class PlatformLimitedDatetime(datetime.datetime):
+        @classmethod
+        def fromtimestamp(cls, *args: Any, **kwargs: Any) -> datetime.datetime:  # type: ignore
+            raise OSError(22, "Invalid argument")
+
+    # some platforms (for example Windows) cannot convert negative or large timestamps with datetime.fromtimestamp
+    monkeypatch.setattr(utcnow.__original_module__, "datetime", PlatformLimitedDatetime)  # type: ignore
+
+    with pytest.raises(ValueError):
+        utcnow.as_datetime(-1)
+    with pytest.raises(ValueError):
+        utcnow.as_string(-1)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        datetime.datetime(1, 1, 1, tzinfo=datetime.timezone(datetime.timedelta(hours=1))),
+        datetime.datetime(9999, 12, 31, 23, tzinfo=datetime.timezone(datetime.timedelta(hours=-2))),
+    ],
+)
+def test_unixtime_datetime_out_of_range_in_utc(value: datetime.datetime) -> None:
+    import utcnow
+
+    with pytest.raises(ValueError):
+        utcnow.as_string(value)
+    with pytest.raises(ValueError):
+        utcnow.as_datetime(value)
+    with pytest.raises(ValueError):
+        utcnow.as_unixtime(value)
+    with pytest.raises(ValueError):
+        utcnow.as_protobuf(value)
+    with pytest.raises(ValueError):
+        utcnow.as_string(value, modifier=7200)
+    with pytest.raises(ValueError):
+        utcnow.as_string(value, modifier=-7200)
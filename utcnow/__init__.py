@@ -49,6 +49,9 @@ The library is specified to return timestamps with 6 fractional second digits, w
 microsecond level. Having a six-digit fraction of a second is currently the most common way that timestamps are shown
 at this date.
 
+Since all returned timestamps are in UTC and have the same fixed length format, they sort lexicographically in the same
+order as chronologically, and can be used as sort keys or be compared directly as strings.
+
 See also:
 ``utcnow.as_date_string(value, tz)``
     Transforms the input value to a string representing a date (YYYY-mm-dd) without timespec or indicated timezone.
@@ -76,8 +79,9 @@ if __name__ not in sys.modules or not getattr(sys.modules[__name__], "__original
     from datetime import datetime, timedelta, timezone, tzinfo
     from decimal import Decimal
     from numbers import Real
+    from sys import intern as intern_
     from types import FunctionType, ModuleType
-    from typing import Any, Callable, Dict, Generic, Optional, Tuple, Type, TypeVar, Union, cast
+    from typing import Any, Callable, Dict, Generic, NamedTuple, Optional, Tuple, Type, TypeVar, Union, cast
 
     from .__version_data__ import __version__, __version_info__
     from .protobuf import TimestampProtobufMessage
@@ -88,6 +92,20 @@ if __name__ not in sys.modules or not getattr(sys.modules[__name__], "__original
     # sentinel
     NOW = TODAY = object()
 
+    # number of days in each month (indexed by month number) for non-leap years
+    DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+    # zero padded two digit strings, indexed by value, used for the month, day, hour, minute and second fields
+    TWO_DIGITS = tuple(f"{i:02d}" for i in range(100))
+
+    # the proleptic gregorian ordinal of 1970-01-01
+    UNIX_EPOCH_ORDINAL = datetime_.date(1970, 1, 1).toordinal()
+
+    # the range of whole second unixtime values that can be represented as datetime objects (0001-01-01T00:00:00Z to
+    # 9999-12-31T23:59:59Z).
+    UNIXTIME_MIN = (datetime_.date.min.toordinal() - UNIX_EPOCH_ORDINAL) * 86400
+    UNIXTIME_MAX = (datetime_.date.max.toordinal() + 1 - UNIX_EPOCH_ORDINAL) * 86400 - 1
+
     # the following formats are accepted as date and date+time as string formatted input values.
     # the library also accepts numeric values (int / float), specified as unixtime, or datetime objects.
     # if no timezone is specified in input, utc is assumed.
@@ -115,14 +133,36 @@ if __name__ not in sys.modules or not getattr(sys.modules[__name__], "__original
         "%Y-%m-%d",
     )
 
+    # features required by values to match each of the accepted formats, used to skip formats that cannot match:
+    # ("T" as date and time separator, "." for fraction of seconds, a timezone declaration, whitespace separator).
+    _ACCEPTED_INPUT_FORMAT_FEATURES = tuple(
+        (format_, "T" in format_, "%f" in format_, "%z" in format_, " " in format_)
+        for format_ in _ACCEPTED_INPUT_FORMAT_VALUES
+    )
+
     # examples: "123", "-123", "123.456", "-123.456", "123.", "-123.", ".456", "-.456"
     NUMERIC_REGEX = re.compile(r"^[-]?([0-9]+|[.][0-9]+|[0-9]+[.]|[0-9]+[.][0-9]+)$")
 
     # examples: "2023-09-06T23:53:59.684762Z", "2023-09-06 23:53:59.684762+00:00"
     PREFERRED_FORMAT_REGEX = re.compile(
-        r"^[0-9]{4}-(0[1-9]|1[012])-(0[1-9]|[12][0-9]|3[01])[Tt ]([01][0-9]|2[0-3]):[0-5][0-9]:[0-5][0-9].[0-9]{6}([Zz]|[+-]00:00|)$"
+        r"^[0-9]{4}-(0[1-9]|1[012])-(0[1-9]|[12][0-9]|3[01])[Tt ]([01][0-9]|2[0-3]):[0-5][0-9]:[0-5][0-9][.][0-9]{6}([Zz]|[+-]00:00|)$"
     )
 
+    # examples: "2023-09-06", "2023-09-06T23:53:59", "2023-09-06 23:53:59Z"
+    SHORT_FORMAT_REGEX = re.compile(r"^[0-9]{4}-[0-9]{2}-[0-9]{2}([T ]([01][0-9]|2[0-3]):[0-9]{2}:[0-9]{2}Z?)?$")
+
+    # examples: "2023-09-06T23:53:59.68+02:00", "2023-09-06 23:53:59-0530", "1985-04-12T23:20:50.52Z", "2023-09-06 23:53Z"
+    OFFSET_FORMAT_REGEX = re.compile(
+        r"^[0-9]{4}-[0-9]{2}-[0-9]{2}[T ]([01][0-9]|2[0-3]):[0-9]{2}(:[0-9]{2}([.][0-9]{1,6})?)?(Z|[+-]([01][0-9]|2[0-3]):?[0-5][0-9])?$"
+    )
+
+    # datetime.fromisoformat accepts the "Z" suffix, fractions of seconds of any precision and offsets without colon
+    # from python 3.11. on earlier versions it's only used for values without fraction of seconds or offset.
+    FROMISOFORMAT_EXTENDED = sys.version_info >= (3, 11)
+
+    # examples: "+01:00", "-0530"
+    TIMEZONE_OFFSET_REGEX = re.compile(r"^[+-]([0-9]{2}):?([0-9]{2})$")
+
     # common modifier multipliers: "s" (seconds), "m" (minutes), "h" (hours), "d" (days)
     # precision modifier multiplicers: "ns" (nanoseconds), "us" (microseconds), "ms" (milliseconds)
     # example: a modifier value of "+10d" => add 10 days.
@@ -307,7 +347,7 @@ if __name__ not in sys.modules or not getattr(sys.modules[__name__], "__original
 
         def __repr__(self) -> str:
             if self._synchronizer is not self:
-                value = self._datetime.isoformat(timespec="microseconds").replace("+00:00", "Z")
+                value = _format_datetime(self._datetime)
                 if self._synchronizer._controller is not self:
                     if self._frozen:
                         return (
@@ -319,7 +359,7 @@ if __name__ not in sys.modules or not getattr(sys.modules[__name__], "__original
                 return f"<utcnow.synchronizer [child: {hex(id(self))}] (pending context) timestamp='{value}'>"
 
             if self._frozen:
-                value = self._datetime.isoformat(timespec="microseconds").replace("+00:00", "Z")
+                value = _format_datetime(self._datetime)
                 return f"<utcnow.synchronizer [main: {hex(id(self))}] (active context) timestamp='{value}'>"
 
             return f"<utcnow.synchronizer [main: {hex(id(self))}]>"
@@ -350,7 +390,123 @@ if __name__ not in sys.modules or not getattr(sys.modules[__name__], "__original
 
     CT = TypeVar("CT", bound=Callable)
 
-    @functools.lru_cache(maxsize=128, typed=False)
+    # sentinel for cache misses (cached values may be falsy)
+    _MISSING = object()
+
+    class _CacheInfo(NamedTuple):
+        hits: int
+        misses: int
+        maxsize: int
+        currsize: int
+
+    def _cache(maxsize: int = 128, typed: bool = False, probation: int = 0) -> Callable[[CT], CT]:
+        """
+        Memoizes a single argument function using a plain dict, exposing the same ``cache_info()`` and
+        ``cache_clear()`` interface as ``functools.lru_cache``. When ``typed`` is set, values of different types are
+        cached separately, although string, float and int values are always used as keys as is, so that a cache hit
+        on such a value is a single dict lookup. An int value and a float value of the same number (as ``1`` and
+        ``1.0``, which are the same timestamp) therefore share a cache entry. Entries are evicted in insertion order
+        (FIFO) once ``maxsize`` is reached.
+
+        When ``probation`` is set, that many of the ``maxsize`` entries are reserved for values that have only been
+        seen once. Such values are moved to the main part of the cache when they are looked up a second time, which
+        keeps a flood of one-off values (for example unique ``time.time()`` floats) from evicting the values that are
+        used repeatedly.
+
+        Args:
+            maxsize: The maximum number of cached entries.
+            typed: If True, values of different types will be cached separately.
+            probation: The number of entries reserved for values that have only been seen once. Defaults to 0.
+
+        Returns:
+            A decorator that wraps the function with the cache.
+        """
+
+        def decorator(func: CT) -> CT:
+            cache: Dict[Any, Any] = {}
+            cache_get = cache.get
+            cache_maxsize = maxsize - probation
+            probation_cache: Dict[Any, Any] = {}
+            probation_pop = probation_cache.pop
+            hits = misses = 0
+
+            def wrapper(value: Any) -> Any:
+                nonlocal hits, misses
+
+                # str, float and int values are used as keys as is, since they never compare equal to the tuple keys
+                # of other types. an int value only shares its entry with a float value of the exact same number (for
+                # example 1 and 1.0). other keys are built as in functools.lru_cache.
+                if type(value) is str or type(value) is float or type(value) is int:
+                    key = value
+                elif typed:
+                    key = (value, type(value))
+                else:
+                    key = (value,)
+
+                result = cache_get(key, _MISSING)
+                if result is not _MISSING:
+                    hits += 1
+                    return result
+
+                if probation:
+                    result = probation_pop(key, _MISSING)
+                    if result is not _MISSING:
+                        # second lookup of the value - promoted from the probation entries to the main cache
+                        hits += 1
+                        if len(cache) >= cache_maxsize:
+                            try:
+                                del cache[next(iter(cache))]
+                            except (KeyError, RuntimeError, StopIteration):  # pragma: no cover
+                                pass
+                        cache[key] = result
+                        return result
+
+                misses += 1
+                result = func(value)
+                target, target_maxsize = (probation_cache, probation) if probation else (cache, cache_maxsize)
+                if len(target) >= target_maxsize:
+                    try:
+                        del target[next(iter(target))]
+                    except (KeyError, RuntimeError, StopIteration):  # pragma: no cover
+                        pass
+                target[key] = result
+                return result
+
+            def cache_info() -> _CacheInfo:
+                return _CacheInfo(hits, misses, maxsize, len(cache) + len(probation_cache))
+
+            def cache_clear() -> None:
+                nonlocal hits, misses
+
+                cache.clear()
+                probation_cache.clear()
+                hits = misses = 0
+
+            functools.update_wrapper(wrapper, func)
+            setattr(wrapper, "cache_info", cache_info)
+            setattr(wrapper, "cache_clear", cache_clear)
+
+            return cast(CT, wrapper)
+
+        return decorator
+
+    def _format_datetime(value: datetime) -> str:
+        """
+        Formats a datetime object in UTC (or a naive datetime object, which is assumed to be UTC) as a timestamp string
+        in RFC 3339 format. Equivalent to ``value.isoformat(timespec="microseconds").replace("+00:00", "Z")``, but
+        formats the fields directly which is considerably faster.
+
+        Args:
+            value: A datetime object in UTC.
+
+        Returns:
+            The datetime value as a string in RFC 3339 format.
+        """
+        return (
+            f"{value.year:04d}-{TWO_DIGITS[value.month]}-{TWO_DIGITS[value.day]}"
+            f"T{TWO_DIGITS[value.hour]}:{TWO_DIGITS[value.minute]}:{TWO_DIGITS[value.second]}.{value.microsecond:06d}Z"
+        )
+
     def _is_numeric(value: str) -> bool:
         """
         Determines if a string represents a numeric value. A numeric values can optionally start with "-" (negative),
@@ -363,6 +519,11 @@ if __name__ not in sys.modules or not getattr(sys.modules[__name__], "__original
         Returns:
             True if the string represents a numeric value, False otherwise.
         """
+        # plain integer values (the most common numeric strings) are matched without the regex. isdigit() also
+        # accepts non-ascii digits, which isascii() rules out.
+        if value.isdigit() and value.isascii():
+            return True
+
         if NUMERIC_REGEX.match(value):
             return True
 
@@ -447,9 +608,8 @@ if __name__ not in sys.modules or not getattr(sys.modules[__name__], "__original
 
         return value, modifier
 
-    @functools.lru_cache(maxsize=128, typed=True)
-    def _transform_value(value: Union[str, datetime, object, int, float, Decimal, Real]) -> str:
-        """Transforms the input value to a timestamp string in RFC 3339 format.
+    def _parse_value(value: Union[str, datetime, object, int, float, Decimal, Real]) -> str:
+        """Transforms the input value to a timestamp string in RFC 3339 format, without caching.
 
         Args:
             value: A value representing a timestamp in any of the allowed input formats.
@@ -462,13 +622,11 @@ if __name__ not in sys.modules or not getattr(sys.modules[__name__], "__original
             if isinstance(value, str):
                 str_value = value.strip()
             elif isinstance(value, (int, float)):
-                return datetime.fromtimestamp(value, tz=UTC).isoformat(timespec="microseconds").replace("+00:00", "Z")
+                return _format_datetime(datetime.fromtimestamp(value, tz=UTC))
+            elif isinstance(value, datetime):
+                return _format_datetime(value if value.utcoffset() is None else value.astimezone(UTC))
             elif isinstance(value, (Decimal, Real)):
-                str_value = (
-                    datetime.fromtimestamp(float(value), tz=UTC)
-                    .isoformat(timespec="microseconds")
-                    .replace("+00:00", "Z")
-                )
+                str_value = _format_datetime(datetime.fromtimestamp(float(value), tz=UTC))
             else:
                 str_value = str(value).strip()
 
@@ -481,34 +639,90 @@ if __name__ not in sys.modules or not getattr(sys.modules[__name__], "__original
                 and str_value.count("-") <= 1
                 and _is_numeric(str_value)
             ):
-                str_value = (
-                    datetime.fromtimestamp(float(str_value), tz=UTC)
-                    .isoformat(timespec="microseconds")
-                    .replace("+00:00", "Z")
-                )
+                str_value = _format_datetime(datetime.fromtimestamp(float(str_value), tz=UTC))
         except Exception:
             raise ValueError(
                 f"The input value '{value}' (type: {value.__class__}) does not match allowed input formats"
             )
 
+        # fast path for the common "YYYY-MM-DD", "YYYY-MM-DDTHH:MM:SS" and "YYYY-MM-DDTHH:MM:SSZ" shapes, which are
+        # validated by datetime.fromisoformat instead of going through the strptime loop below.
+        if len(str_value) in (10, 19, 20) and SHORT_FORMAT_REGEX.match(str_value):
+            try:
+                datetime.fromisoformat(str_value[0:19])
+            except ValueError:
+                raise ValueError(
+                    f"The input value '{value}' (type: {value.__class__}) does not match allowed input formats"
+                )
+            if len(str_value) == 10:
+                return str_value + "T00:00:00.000000Z"
+            return str_value[0:10] + "T" + str_value[11:19] + ".000000Z"
+
         if PREFERRED_FORMAT_REGEX.match(str_value):
-            if int(str_value[8:10]) >= 30 or (int(str_value[5:7]) == 2 and int(str_value[8:10]) >= 28):
-                try:
-                    dt_value = datetime.strptime(str_value[0:10], "%Y-%m-%d")
-                except ValueError:
+            day = int(str_value[8:10])
+            if day >= 28:
+                year = int(str_value[0:4])
+                month = int(str_value[5:7])
+                days_in_month = DAYS_IN_MONTH[month] + (
+                    month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+                )
+                if day > days_in_month or (not year and (day >= 30 or month == 2)):
                     raise ValueError(
                         f"The input value '{value}' (type: {value.__class__}) does not match allowed input formats"
                     )
-            return (str_value[:10] + "T" + str_value[11:]).upper().rstrip("Z").rsplit("+00:00")[0].rsplit("-00:00")[
-                0
-            ] + "Z"
+            if len(str_value) == 27 and str_value[10] == "T" and str_value[26] == "Z":
+                # the value is already in the format of the returned values
+                return str_value
+            return str_value[0:10] + "T" + str_value[11:19] + "." + str_value[20:26] + "Z"
 
         ends_with_utc = False
         if str_value.endswith(" UTC"):
             str_value = str_value[0:-4]
             ends_with_utc = True
 
-        for format_ in _ACCEPTED_INPUT_FORMAT_VALUES:
+        # values with minute precision, a fraction of seconds of any precision and / or a timezone offset (or a " UTC"
+        # suffix), where the offset is converted using the cached timezone objects instead of going through the
+        # strptime loop below.
+        # values with both an offset and a " UTC" suffix are left for the strptime loop to reject.
+        match = OFFSET_FORMAT_REGEX.match(str_value)
+        if match and not (ends_with_utc and match.group(4)):
+            try:
+                if FROMISOFORMAT_EXTENDED:
+                    dt_value = datetime.fromisoformat(str_value)
+                else:
+                    seconds, fraction, offset = match.group(2, 3, 4)
+                    dt_value = datetime(
+                        int(str_value[0:4]),
+                        int(str_value[5:7]),
+                        int(str_value[8:10]),
+                        int(str_value[11:13]),
+                        int(str_value[14:16]),
+                        int(seconds[1:3]) if seconds else 0,
+                        int(fraction[1:].ljust(6, "0")) if fraction else 0,
+                        tzinfo=_timezone_from_string(offset) if offset else UTC,
+                    )
+            except ValueError:
+                raise ValueError(
+                    f"The input value '{value}' (type: {value.__class__}) does not match allowed input formats"
+                )
+            # naive values are assumed to be in UTC and are formatted as is
+            return _format_datetime(dt_value if dt_value.tzinfo is None else dt_value.astimezone(UTC))
+
+        # a timezone declaration is either "Z" or an offset, which adds a "+" or a third "-" to the value
+        has_t = "T" in str_value or "t" in str_value
+        has_f = "." in str_value
+        has_tz = "Z" in str_value or "z" in str_value or "+" in str_value or str_value.count("-") > 2
+        has_space = len(str_value.split(maxsplit=1)) > 1
+
+        for format_, format_t, format_f, format_tz, format_space in _ACCEPTED_INPUT_FORMAT_FEATURES:
+            if (
+                format_t is not has_t
+                or format_tz is not has_tz
+                or (format_f and not has_f)
+                or (format_space and not has_space)
+            ):
+                continue
+
             try:
                 dt_value = datetime.strptime(str_value, format_)
             except ValueError:
@@ -527,9 +741,23 @@ if __name__ not in sys.modules or not getattr(sys.modules[__name__], "__original
 
         if not dt_value.tzinfo:
             # Timezone declaration missing, skipping tz application and blindly assuming UTC
-            return dt_value.isoformat(timespec="microseconds") + "Z"
+            return _format_datetime(dt_value)
+
+        return _format_datetime(dt_value.astimezone(UTC))
 
-        return dt_value.astimezone(UTC).isoformat(timespec="microseconds").replace("+00:00", "Z")
+    @_cache(maxsize=128, typed=True, probation=32)
+    def _transform_value(value: Union[str, datetime, object, int, float, Decimal, Real]) -> str:
+        """Transforms the input value to a timestamp string in RFC 3339 format.
+
+        Args:
+            value: A value representing a timestamp in any of the allowed input formats.
+
+        Returns:
+            The transformed value as a string in RFC 3339 format.
+        """
+        # equal results of different input values (for example 1, "1.0" and "1970-01-01T00:00:01Z") share a single
+        # string object, which is kept once in the cache and compares by identity.
+        return intern_(_parse_value(value))
 
     @functools.lru_cache(maxsize=128)
     def _timestamp_to_datetime(value: str) -> datetime:
@@ -541,8 +769,26 @@ if __name__ not in sys.modules or not getattr(sys.modules[__name__], "__original
         Returns:
             The transformed value as a datetime object.
         """
+        if type(value) is datetime:
+            # datetime values are converted directly, instead of being transformed to (and parsed from) a string first
+            if value.utcoffset() is None:
+                # Timezone declaration missing, blindly assuming UTC
+                return value.replace(tzinfo=UTC, fold=0)
+            if value.tzinfo is not UTC:
+                try:
+                    return value.astimezone(UTC)
+                except OverflowError:
+                    # the value is within the datetime range in its own timezone, but not in UTC
+                    raise ValueError(
+                        f"The input value '{value}' (type: {value.__class__}) does not match allowed input formats"
+                    )
+            return value if not value.fold else value.replace(fold=0)
+
         value = _transform_value(value)
-        return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z")
+
+        # the transformed value is always in the "YYYY-MM-DDTHH:MM:SS.ffffffZ" format, which (apart from the "Z" suffix)
+        # can be parsed by the C implemented datetime.fromisoformat on all supported Python versions.
+        return datetime.fromisoformat(value[0:26] + "+00:00")
 
     @functools.lru_cache(maxsize=128)
     def _timestamp_to_unixtime(value: str) -> float:
@@ -554,6 +800,23 @@ if __name__ not in sys.modules or not getattr(sys.modules[__name__], "__original
         Returns:
             The transformed value in unixtime (float).
         """
+        if isinstance(value, datetime):
+            # datetime values are converted directly, instead of being transformed to (and parsed from) a string first
+            if value.utcoffset() is None:
+                # Timezone declaration missing, blindly assuming UTC. the value is computed from the fields (the same
+                # way as datetime.timestamp() does for aware values) instead of through a copy with a UTC tzinfo.
+                return (
+                    (
+                        (value.toordinal() - UNIX_EPOCH_ORDINAL) * 86400
+                        + value.hour * 3600
+                        + value.minute * 60
+                        + value.second
+                    )
+                    * 1_000_000
+                    + value.microsecond
+                ) / 1_000_000
+
+        # aware values are converted to UTC first, which also rejects values outside of the datetime range in UTC
         return _timestamp_to_datetime(value).timestamp()
 
     @functools.lru_cache(maxsize=128)
@@ -605,7 +868,7 @@ if __name__ not in sys.modules or not getattr(sys.modules[__name__], "__original
             return UTC
 
         if value and value[0] in ("+", "-"):
-            m = re.match(r"^[+-]([0-9]{2}):?([0-9]{2})$", value)
+            m = TIMEZONE_OFFSET_REGEX.match(value)
             if not m:
                 return None
 
@@ -648,13 +911,14 @@ if __name__ not in sys.modules or not getattr(sys.modules[__name__], "__original
             Raises:
                 ValueError: If the input value does not match allowed input formats.
             """
+            if value is NOW and not modifier:
+                return _format_datetime(synchronizer.datetime)
+
             value, modifier = _init_modifier(value, modifier)
 
             if value is NOW:
-                return (
-                    (synchronizer.datetime if not modifier else synchronizer.datetime + timedelta(seconds=modifier))
-                    .isoformat(timespec="microseconds")
-                    .replace("+00:00", "Z")
+                return _format_datetime(
+                    synchronizer.datetime if not modifier else synchronizer.datetime + timedelta(seconds=modifier)
                 )
             return (
                 _transform_value(value) if not modifier else _transform_value(_timestamp_to_unixtime(value) + modifier)
@@ -683,10 +947,10 @@ if __name__ not in sys.modules or not getattr(sys.modules[__name__], "__original
             return result
 
         def __str__(self) -> str:
-            return synchronizer.datetime.isoformat(timespec="microseconds").replace("+00:00", "Z")
+            return _format_datetime(synchronizer.datetime)
 
         def __repr__(self) -> str:
-            return synchronizer.datetime.isoformat(timespec="microseconds").replace("+00:00", "Z")
+            return _format_datetime(synchronizer.datetime)
 
     class utcnow_(_baseclass):
         now = type("now", (now_,), {})()
@@ -745,13 +1009,14 @@ if __name__ not in sys.modules or not getattr(sys.modules[__name__], "__original
                 >>> utcnow.rfc3339_timestamp(dt)
                 "2023-04-30T06:00:00.000000Z"
             """
+            if value is NOW and not modifier:
+                return _format_datetime(synchronizer.datetime)
+
             value, modifier = _init_modifier(value, modifier)
 
             if value is NOW:
-                return (
-                    (synchronizer.datetime if not modifier else synchronizer.datetime + timedelta(seconds=modifier))
-                    .isoformat(timespec="microseconds")
-                    .replace("+00:00", "Z")
+                return _format_datetime(
+                    synchronizer.datetime if not modifier else synchronizer.datetime + timedelta(seconds=modifier)
                 )
             return (
                 _transform_value(value) if not modifier else _transform_value(_timestamp_to_unixtime(value) + modifier)
@@ -781,6 +1046,18 @@ if __name__ not in sys.modules or not getattr(sys.modules[__name__], "__original
                 >>> utcnow.as_datetime("2023-08-01 12:10:59.123456+02:00")
                 datetime.datetime(2023, 8, 1, 10, 10, 59, 123456, tzinfo=datetime.timezone.utc)
             """
+            if value is NOW and not modifier:
+                return synchronizer.datetime
+            if type(value) is int and not modifier and UNIXTIME_MIN <= value <= UNIXTIME_MAX:
+                # integer unixtime values are converted directly, since they rarely repeat enough to gain from caching
+                try:
+                    return datetime.fromtimestamp(value, UTC)
+                except Exception:
+                    # fromtimestamp may raise OverflowError or OSError for values outside of the platform's range
+                    raise ValueError(
+                        f"The input value '{value}' (type: {value.__class__}) does not match allowed input formats"
+                    )
+
             value, modifier = _init_modifier(value, modifier)
 
             if value is NOW:
@@ -819,6 +1096,12 @@ if __name__ not in sys.modules or not getattr(sys.modules[__name__], "__original
                 >>> utcnow.as_unixtime("2022-01-01 00:00:00.123456+00:00")
                 1640995200.123456
             """
+            if value is NOW and not modifier:
+                return synchronizer.time
+            if type(value) is int and not modifier and UNIXTIME_MIN <= value <= UNIXTIME_MAX:
+                # integer unixtime values are already whole seconds, which are returned as is (as float)
+                return float(value)
+
             value, modifier = _init_modifier(value, modifier)
 
             if value is NOW:
@@ -839,7 +1122,8 @@ if __name__ not in sys.modules or not getattr(sys.modules[__name__], "__original
                     Can also be set to a negative value, for example "-1h" (1 hour => -3600 seconds).
 
             Returns:
-                The transformed value as a google.protobuf.Timestamp message.
+                The transformed value as a google.protobuf.Timestamp message. The message may be shared between calls
+                with the same value and should not be modified (use CopyFrom on a new message for a mutable copy).
 
             Raises:
                 ValueError: If the input value does not match allowed input formats.
@@ -978,6 +1262,9 @@ if __name__ not in sys.modules or not getattr(sys.modules[__name__], "__original
                 )
 
             if value is TODAY or (isinstance(value, str) and str(value).lower() in ("now", "today")):
+                if date_tz is UTC:
+                    # the current date in UTC is given by the number of whole days since the unix epoch
+                    return datetime_.date.fromordinal(UNIX_EPOCH_ORDINAL + int(synchronizer.time // 86400)).isoformat()
                 return datetime_.datetime.fromtimestamp(synchronizer.time, tz=date_tz).date().isoformat()
 
             return _timestamp_to_datetime(value).astimezone(date_tz).date().isoformat()
@@ -1125,10 +1412,10 @@ if __name__ not in sys.modules or not getattr(sys.modules[__name__], "__original
         todays_date = _deprecation_decorator(today, "utcnow.todays_date")
 
         def __str__(self) -> str:
-            return self.rfc3339_timestamp()
+            return _format_datetime(synchronizer.datetime)
 
         def __repr__(self) -> str:
-            return self.rfc3339_timestamp()
+            return _format_datetime(synchronizer.datetime)
 
     def staticmethod_(func: CT) -> CT:
         return cast(CT, staticmethod(func))
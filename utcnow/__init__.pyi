@@ -116,7 +116,8 @@ def as_protobuf(
             Can also be set to a negative value, for example "-1h" (1 hour => -3600 seconds).
 
     Returns:
-        The transformed value as a google.protobuf.Timestamp message.
+        The transformed value as a google.protobuf.Timestamp message. The message may be shared between calls
+        with the same value and should not be modified (use CopyFrom on a new message for a mutable copy).
 
     Raises:
         ValueError: If the input value does not match allowed input formats.
@@ -228,7 +229,6 @@ def today(
         "2023-09-08"  # current date in a timezone with UTC offset +01:00
     """
 
-@functools.lru_cache(maxsize=128, typed=False)
 def _is_numeric(value: str) -> bool:
     """
     Determines if a string represents a numeric value. A numeric values can optionally start with "-" (negative),
@@ -521,7 +521,8 @@ class utcnow(str):
                 Can also be set to a negative value, for example "-1h" (1 hour => -3600 seconds).
 
         Returns:
-            The transformed value as a google.protobuf.Timestamp message.
+            The transformed value as a google.protobuf.Timestamp message. The message may be shared between calls
+            with the same value and should not be modified (use CopyFrom on a new message for a mutable copy).
 
         Raises:
             ValueError: If the input value does not match allowed input formats.
@@ -921,7 +922,8 @@ class now(str):
                 Can also be set to a negative value, for example "-1h" (1 hour => -3600 seconds).
 
         Returns:
-            The transformed value as a google.protobuf.Timestamp message.
+            The transformed value as a google.protobuf.Timestamp message. The message may be shared between calls
+            with the same value and should not be modified (use CopyFrom on a new message for a mutable copy).
 
         Raises:
             ValueError: If the input value does not match allowed input formats.
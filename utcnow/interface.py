@@ -35,14 +35,16 @@ def cli_entrypoint(argv: Optional[List[str]] = None) -> int:
             # utcnow --help
             from utcnow import __version__  # isort:skip
 
-            print("usage:")
-            print("  utcnow [values ...]              | default     output in rfc3339 format")
-            print("  utcnow --unixtime [values ...]   | short: -u   output as unixtime")
-            print("  utcnow --diff <from> <to>        | short: -d   diff in seconds: from -> to")
-            print("")
-            print("help:")
-            print("  utcnow --help                    | short: -h   display this message")
-            print(f"  utcnow --version                 | short: -v   installed version ({__version__})")
+            print(
+                "usage:\n"
+                "  utcnow [values ...]              | default     output in rfc3339 format\n"
+                "  utcnow --unixtime [values ...]   | short: -u   output as unixtime\n"
+                "  utcnow --diff <from> <to>        | short: -d   diff in seconds: from -> to\n"
+                "\n"
+                "help:\n"
+                "  utcnow --help                    | short: -h   display this message\n"
+                f"  utcnow --version                 | short: -v   installed version ({__version__})"
+            )
         elif argv and ("-d" in argv or "--diff" in argv):
             usage = "utcnow --diff <from> <to>"
             argv = [v for v in argv if v not in ("-d", "--diff")]
@@ -120,14 +122,15 @@ def cli_entrypoint(argv: Optional[List[str]] = None) -> int:
                     )
                     for v in argv
                 ]
-                output = ""
+                output_values: List[str] = []
                 for value in values:
                     try:
-                        output += rfc3339_timestamp(value) if output_unixtime is False else str(as_unixtime(value))
-                        output += "\n"
+                        output_values.append(
+                            rfc3339_timestamp(value) if output_unixtime is False else str(as_unixtime(value))
+                        )
                     except ValueError:
                         print(error_message(f'invalid input value: "{value}".'), file=sys.stderr)
                         return 1
-                print(output.strip("\n"))
+                print("\n".join(output_values))
 
     return 0